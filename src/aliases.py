@@ -1,6 +1,7 @@
 '''Implements the aliases class.'''
 
 from typing import Optional
+from types import MappingProxyType
 import json
 from paths import File
 from messages import Messages
@@ -11,6 +12,8 @@ class Aliases:
     file: File  # the file storing aliases
     message: Messages  # the message object that handles printing
     aliases: dict[str, str]  # the aliases
+    aliases_view: MappingProxyType[str, str]  # the read-only view of the aliases
+    aliases_args: dict[str, tuple[str, ...]]  # the aliases split into args, kept in sync with aliases
 
     def __init__(self, file: File, message: Messages) -> None:
         '''
@@ -25,30 +28,39 @@ class Aliases:
             self.aliases = json.loads(self.file.read_file())
         else:
             self.update_aliases()
+        self.aliases_view = MappingProxyType(self.aliases)
+        self.aliases_args = {alias_name: tuple(alias_str.split()) for alias_name, alias_str in self.aliases.items()}
 
     def update_aliases(self) -> None:
         '''
         Update the aliases file.
         '''
-        self.file.write_file(json.dumps(self.aliases))
+        self.file.write_file_atomic(json.dumps(self.aliases))
 
-    def add_alias(self, alias_name: str, alias_str: str) -> None:
+    def add_alias(self, alias_name: str, alias_args: list[str]) -> str:
         '''
         Add an alias or update one if it already exists.
         :param alias_name: alias' name
-        :param alias_str: alias' string
+        :param alias_args: alias' args, already split so they aren't split again
+        :return: alias' string, the args joined by single spaces
         '''
+        alias_str = ' '.join(alias_args)
         self.aliases[alias_name] = alias_str
+        self.aliases_args[alias_name] = tuple(alias_args)
         self.update_aliases()
+        return alias_str
 
-    def remove_alias(self, alias_name: str) -> None:
+    def remove_alias(self, alias_name: str) -> bool:
         '''
         Remove an alias.
         :param alias_name: alias' name
+        :return: True if the alias existed and was removed or False otherwise
         '''
-        if alias_name in self.aliases:
-            del self.aliases[alias_name]
-            self.update_aliases()
+        if self.aliases.pop(alias_name, None) is None:  # alias strings are never None
+            return False
+        del self.aliases_args[alias_name]
+        self.update_aliases()
+        return True
 
     def __contains__(self, alias_name: str) -> bool:
         '''
@@ -64,10 +76,19 @@ class Aliases:
         :param alias_name: alias' name, must be one of the aliases
         :return: the alias
         '''
-        if alias_name in self.aliases:
-            return self.aliases[alias_name]
-        else:
-            assert False  # alias_name must be one of the aliases
+        alias_str = self.aliases.get(alias_name)  # alias strings are never None
+        assert alias_str is not None  # alias_name must be one of the aliases
+        return alias_str
+
+    def get_alias_args(self, alias_name: str) -> tuple[str, ...]:
+        '''
+        Get an alias split into args, split once when the alias is added.
+        :param alias_name: alias' name, must be one of the aliases
+        :return: the alias' args
+        '''
+        alias_args = self.aliases_args.get(alias_name)  # alias args are never None
+        assert alias_args is not None  # alias_name must be one of the aliases
+        return alias_args
 
     def get_alias_names(self) -> list[str]:
         '''
@@ -83,6 +104,6 @@ class Aliases:
         :param alias_name: the alias to print the help string for, must be one of the aliases
         '''
         if alias_name is None:
-            self.message.alias_all_help_str(self.aliases.copy())
+            self.message.alias_all_help_str(self.aliases_view)
         else:
             self.message.alias_help_str(alias_name, self.aliases[alias_name])
@@ -1,6 +1,6 @@
 '''Implements the argument class.'''
 
-from typing import Protocol, Optional, Literal
+from typing import Protocol, Optional, Literal, Callable
 import re
 import json
 from enum import IntEnum
@@ -9,13 +9,20 @@ from messages import Messages
 
 NumArgs = int | Literal['+', '*', '?']
 
+# the compiled regex used to check float args
+_FLOAT_RE = re.compile(r'-?([0-9]+|[0-9]*\.[0-9]+)')
+
 
 class Argument(Protocol):
     '''An immutable argument class to parse arguments.'''
+    __slots__ = ()  # no instance dict for the arguments
     dict_name: str  # the name in the dict
     num_args: NumArgs  # the number of arguments needed
     message: Messages  # the message object that handles printing
     help_str: str  # the help string
+    choices: Optional[list[str]]  # list of choices
+    choices_set: Optional[frozenset[str]]  # the choices as a set for validation
+    num_range: Optional[tuple[float, float]]  # the possible range [l, r]
 
     def get_name_long(self) -> str:
         '''
@@ -59,8 +66,15 @@ class PositionalArgumentMode(IntEnum):
     FLOAT_RANGE = 6  # float argument in a range
 
 
+POSITIONAL_RANGE_MODES = frozenset({PositionalArgumentMode.INT_RANGE, PositionalArgumentMode.FLOAT_RANGE})
+
+
 class PositionalArgument(Argument):
     '''An immutable positional argument class to parse positional arguments in order.'''
+    __slots__ = (
+        'name', 'dict_name', 'num_args', 'mode', 'message', 'help_str', 'choices', 'choices_set', 'num_range',
+        'validate_mode'
+    )
     name: str  # the name
     dict_name: str  # the name in the dict
     num_args: NumArgs  # the number of arguments needed
@@ -68,7 +82,9 @@ class PositionalArgument(Argument):
     message: Messages  # the message object that handles printing
     help_str: str  # the help string
     choices: Optional[list[str]]  # list of choices
+    choices_set: Optional[frozenset[str]]  # the choices as a set for validation
     num_range: Optional[tuple[float, float]]  # the possible range [l, r]
+    validate_mode: 'Validator'  # checks the mode conditions of the args
 
     def __init__(self, name: str, dict_name: str, num_args: NumArgs, mode: PositionalArgumentMode,
                  message: Messages, help_str: str,
@@ -91,15 +107,19 @@ class PositionalArgument(Argument):
         self.message = message
         self.help_str = help_str
         self.choices = choices
+        self.choices_set = frozenset(choices) if choices is not None else None
         self.num_range = num_range
+        self.validate_mode = POSITIONAL_VALIDATORS[self.mode]
 
-        # assert the mode has the required arguments
-        assert bool(self.mode == PositionalArgumentMode.CHOICES) == bool(self.choices is not None)
-        assert (bool(self.mode in [PositionalArgumentMode.INT_RANGE, PositionalArgumentMode.FLOAT_RANGE])
-                == bool(self.num_range is not None))
+        # check the mode has the required arguments, raised so the checks also hold under -O
+        if bool(self.mode == PositionalArgumentMode.CHOICES) != bool(self.choices is not None):
+            raise ValueError(f'choices should be given exactly when mode is choices for {self.name}')
+        if bool(self.mode in POSITIONAL_RANGE_MODES) != bool(self.num_range is not None):
+            raise ValueError(f'num_range should be given exactly when mode is a range for {self.name}')
 
         # positional arguments can't have num_args == 0
-        assert self.num_args != 0
+        if self.num_args == 0:
+            raise ValueError(f'positional argument {self.name} can\'t have num_args == 0')
 
     def get_name_long(self) -> str:
         '''
@@ -145,45 +165,9 @@ class PositionalArgument(Argument):
         if self.num_args == '+' and len(args) == 0:
             self.message.expected_at_least_one_argument(self.get_name_long())
 
-        # check the mode conditions and parse the arguments
-        if self.mode == PositionalArgumentMode.ANY:
-            pass
-        elif self.mode == PositionalArgumentMode.INT:
-            for arg in args:
-                if not is_int(arg):
-                    self.message.argument_not_int(self.get_name_long(), arg)
-                    return None
-        elif self.mode == PositionalArgumentMode.FLOAT:
-            for arg in args:
-                if not is_float(arg):
-                    self.message.argument_not_float(self.get_name_long(), arg)
-                    return None
-        elif self.mode == PositionalArgumentMode.CHOICES:
-            assert self.choices is not None  # choices should be given when mode is 'choices'
-            for arg in args:
-                if arg not in self.choices:
-                    self.message.argument_not_in_choices(self.get_name_long(), arg, self.choices)
-                    return None
-        elif self.mode == PositionalArgumentMode.INT_RANGE:
-            assert self.num_range is not None  # num_range should be given when mode is 'int_range'
-            for arg in args:
-                if not is_int(arg):
-                    self.message.argument_not_int(self.get_name_long(), arg)
-                    return None
-                if not self.num_range[0] <= int(arg) <= self.num_range[1]:
-                    self.message.argument_not_in_range(self.get_name_long(), arg, self.num_range)
-                    return None
-        elif self.mode == PositionalArgumentMode.FLOAT_RANGE:
-            assert self.num_range is not None  # num_range should be given when mode is 'float_range'
-            for arg in args:
-                if not is_float(arg):
-                    self.message.argument_not_float(self.get_name_long(), arg)
-                    return None
-                if not self.num_range[0] <= float(arg) <= self.num_range[1]:
-                    self.message.argument_not_in_range(self.get_name_long(), arg, self.num_range)
-                    return None
-        else:
-            assert False
+        # check the mode conditions
+        if not self.validate_mode(self, args):
+            return None
 
         # return the parsed arguments
         if self.num_args == 1:
@@ -209,8 +193,15 @@ class OptionalArgumentMode(IntEnum):
     BOOL_FLAG = 7  # True when the flag is given, False otherwise
 
 
+OPTIONAL_RANGE_MODES = frozenset({OptionalArgumentMode.INT_RANGE, OptionalArgumentMode.FLOAT_RANGE})
+
+
 class OptionalArgument(Argument):
     '''An immutable optional argument class to parse optional arguments given with flags.'''
+    __slots__ = (
+        'short_flag', 'long_flag', 'dict_name', 'num_args', 'mode', 'message', 'help_str', 'default', 'choices',
+        'choices_set', 'num_range', 'validate_mode', 'name_long', 'name_short'
+    )
     short_flag: str  # the short one character flag with one dash at the start
     long_flag: str  # the long flag with two dashes at the start
     dict_name: str  # the name in the dict
@@ -220,7 +211,11 @@ class OptionalArgument(Argument):
     help_str: str  # the help string
     default: Optional[list[str]]  # the args to be used when flag is not given or None to use None in that case
     choices: Optional[list[str]]  # list of choices
+    choices_set: Optional[frozenset[str]]  # the choices as a set for validation
     num_range: Optional[tuple[float, float]]  # the possible range [l, r]
+    validate_mode: 'Validator'  # checks the mode conditions of the args
+    name_long: str  # the long name of the argument
+    name_short: str  # the short name of the argument
 
     def __init__(self, short_flag: str, long_flag: str, dict_name: str, num_args: NumArgs,
                  mode: OptionalArgumentMode, message: Messages, help_str: str, default: Optional[list[str]],
@@ -247,28 +242,33 @@ class OptionalArgument(Argument):
         self.help_str = help_str
         self.default = default
         self.choices = choices
+        self.choices_set = frozenset(choices) if choices is not None else None
         self.num_range = num_range
-
-        # assert the mode has the required arguments
-        assert bool(self.mode == OptionalArgumentMode.CHOICES) == bool(self.choices is not None)
-        assert (bool(self.mode in [OptionalArgumentMode.INT_RANGE, OptionalArgumentMode.FLOAT_RANGE])
-                == bool(self.num_range is not None))
-        if self.mode == OptionalArgumentMode.BOOL_FLAG:
-            assert self.num_args == 0
+        self.validate_mode = OPTIONAL_VALIDATORS[self.mode]
+        self.name_long = f'{self.short_flag}, {self.long_flag}'
+        self.name_short = self.long_flag[2:]  # remove the two dashes at the start
+
+        # check the mode has the required arguments, raised so the checks also hold under -O
+        if bool(self.mode == OptionalArgumentMode.CHOICES) != bool(self.choices is not None):
+            raise ValueError(f'choices should be given exactly when mode is choices for {self.long_flag}')
+        if bool(self.mode in OPTIONAL_RANGE_MODES) != bool(self.num_range is not None):
+            raise ValueError(f'num_range should be given exactly when mode is a range for {self.long_flag}')
+        if self.mode == OptionalArgumentMode.BOOL_FLAG and self.num_args != 0:
+            raise ValueError(f'bool flag {self.long_flag} should have num_args == 0')
 
     def get_name_long(self) -> str:
         '''
         Get the argument's name for full descriptions in help strings and error messages.
         :return: the long name of the argument
         '''
-        return ', '.join([self.short_flag, self.long_flag])
+        return self.name_long
 
     def get_name_short(self) -> str:
         '''
         Get the argument's name for short descriptions in help strings and error messages.
         :return: the short name of the argument
         '''
-        return self.long_flag[2:]  # remove the two dashes at the start
+        return self.name_short
 
     def get_num_args(self, num_available: int) -> int:
         '''
@@ -309,46 +309,10 @@ class OptionalArgument(Argument):
             self.message.expected_at_least_one_argument(self.get_name_long())
 
         # check the mode conditions and parse the arguments
-        if self.mode == OptionalArgumentMode.ANY:
-            pass
-        elif self.mode == OptionalArgumentMode.INT:
-            for arg in args:
-                if not is_int(arg):
-                    self.message.argument_not_int(self.get_name_long(), arg)
-                    return None
-        elif self.mode == OptionalArgumentMode.FLOAT:
-            for arg in args:
-                if not is_float(arg):
-                    self.message.argument_not_float(self.get_name_long(), arg)
-                    return None
-        elif self.mode == OptionalArgumentMode.CHOICES:
-            assert self.choices is not None  # choices should be given when mode is 'choices'
-            for arg in args:
-                if arg not in self.choices:
-                    self.message.argument_not_in_choices(self.get_name_long(), arg, self.choices)
-                    return None
-        elif self.mode == OptionalArgumentMode.INT_RANGE:
-            assert self.num_range is not None  # num_range should be given when mode is 'int_range'
-            for arg in args:
-                if not is_int(arg):
-                    self.message.argument_not_int(self.get_name_long(), arg)
-                    return None
-                if not self.num_range[0] <= int(arg) <= self.num_range[1]:
-                    self.message.argument_not_in_range(self.get_name_long(), arg, self.num_range)
-                    return None
-        elif self.mode == OptionalArgumentMode.FLOAT_RANGE:
-            assert self.num_range is not None  # num_range should be given when mode is 'float_range'
-            for arg in args:
-                if not is_float(arg):
-                    self.message.argument_not_float(self.get_name_long(), arg)
-                    return None
-                if not self.num_range[0] <= float(arg) <= self.num_range[1]:
-                    self.message.argument_not_in_range(self.get_name_long(), arg, self.num_range)
-                    return None
-        elif self.mode == OptionalArgumentMode.BOOL_FLAG:
+        if not self.validate_mode(self, args):
+            return None
+        if self.mode == OptionalArgumentMode.BOOL_FLAG:
             args = ['True' if flag_given else 'False']
-        else:
-            assert False
 
         # return the parsed arguments
         if self.num_args == 1:
@@ -369,7 +333,8 @@ class OptionalArgument(Argument):
         :param arg: the given argument
         :return: True if the argument is a flag, False otherwise
         '''
-        return len(arg) >= 1 and arg[0] == '-' and all(c.isalpha() or c == '-' for c in arg)
+        letters = arg.replace('-', '')
+        return arg.startswith('-') and (letters == '' or letters.isalpha())  # so negative numbers aren't flags
 
 
 def is_int(arg: str) -> bool:
@@ -378,7 +343,8 @@ def is_int(arg: str) -> bool:
     :param arg: the argument
     :return: true if the argument is an int, false otherwise
     '''
-    return re.fullmatch(r'-?[0-9]+', arg) is not None
+    digits = arg[1:] if arg.startswith('-') else arg
+    return digits.isascii() and digits.isdigit()  # isascii since isdigit also accepts non-ascii digits
 
 
 def is_float(arg: str) -> bool:
@@ -387,4 +353,118 @@ def is_float(arg: str) -> bool:
     :param arg: the argument
     :return: true if the argument is a float, false otherwise
     '''
-    return re.fullmatch(r'-?([0-9]+|[0-9]*\.[0-9]+)', arg) is not None
+    return _FLOAT_RE.fullmatch(arg) is not None
+
+
+Validator = Callable[[Argument, list[str]], bool]  # checks the mode conditions of the args and prints failures
+
+
+def validate_any(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in any mode.
+    :param argument: the argument
+    :param args: the given args
+    :return: True since any args are valid
+    '''
+    return True
+
+
+def validate_int(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in int mode.
+    :param argument: the argument
+    :param args: the given args
+    :return: True if all args are ints, False otherwise
+    '''
+    for arg in args:
+        if not is_int(arg):
+            argument.message.argument_not_int(argument.get_name_long(), arg)
+            return False
+    return True
+
+
+def validate_float(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in float mode.
+    :param argument: the argument
+    :param args: the given args
+    :return: True if all args are floats, False otherwise
+    '''
+    for arg in args:
+        if not is_float(arg):
+            argument.message.argument_not_float(argument.get_name_long(), arg)
+            return False
+    return True
+
+
+def validate_choices(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in choices mode.
+    :param argument: the argument, choices should be given
+    :param args: the given args
+    :return: True if all args are in choices, False otherwise
+    '''
+    assert argument.choices is not None and argument.choices_set is not None  # given when mode is 'choices'
+    for arg in args:
+        if arg not in argument.choices_set:
+            argument.message.argument_not_in_choices(argument.get_name_long(), arg, argument.choices)
+            return False
+    return True
+
+
+def validate_int_range(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in int range mode.
+    :param argument: the argument, num_range should be given
+    :param args: the given args
+    :return: True if all args are ints in the range, False otherwise
+    '''
+    assert argument.num_range is not None  # num_range should be given when mode is 'int_range'
+    for arg in args:
+        if not is_int(arg):
+            argument.message.argument_not_int(argument.get_name_long(), arg)
+            return False
+        if not argument.num_range[0] <= int(arg) <= argument.num_range[1]:
+            argument.message.argument_not_in_range(argument.get_name_long(), arg, argument.num_range)
+            return False
+    return True
+
+
+def validate_float_range(argument: Argument, args: list[str]) -> bool:
+    '''
+    Check the args of an argument in float range mode.
+    :param argument: the argument, num_range should be given
+    :param args: the given args
+    :return: True if all args are floats in the range, False otherwise
+    '''
+    assert argument.num_range is not None  # num_range should be given when mode is 'float_range'
+    for arg in args:
+        if not is_float(arg):
+            argument.message.argument_not_float(argument.get_name_long(), arg)
+            return False
+        if not argument.num_range[0] <= float(arg) <= argument.num_range[1]:
+            argument.message.argument_not_in_range(argument.get_name_long(), arg, argument.num_range)
+            return False
+    return True
+
+
+# the mode validators of positional arguments
+POSITIONAL_VALIDATORS: dict[PositionalArgumentMode, Validator] = {
+    PositionalArgumentMode.ANY: validate_any,
+    PositionalArgumentMode.INT: validate_int,
+    PositionalArgumentMode.FLOAT: validate_float,
+    PositionalArgumentMode.CHOICES: validate_choices,
+    PositionalArgumentMode.INT_RANGE: validate_int_range,
+    PositionalArgumentMode.FLOAT_RANGE: validate_float_range,
+}
+
+# the mode validators of optional arguments, bool flags have no args to check
+OPTIONAL_VALIDATORS: dict[OptionalArgumentMode, Validator] = {
+    OptionalArgumentMode.ANY: validate_any,
+    OptionalArgumentMode.INT: validate_int,
+    OptionalArgumentMode.FLOAT: validate_float,
+    OptionalArgumentMode.CHOICES: validate_choices,
+    OptionalArgumentMode.INT_RANGE: validate_int_range,
+    OptionalArgumentMode.FLOAT_RANGE: validate_float_range,
+    OptionalArgumentMode.BOOL_FLAG: validate_any,
+}
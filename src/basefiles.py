@@ -7,7 +7,7 @@ using namespace std;
 typedef long long ll;
 """
 
-MAIN_CPP: str = """\
+MAIN_CPP: bytes = b"""\
 int main() {
     ios::sync_with_stdio(0);
     cin.tie(0);
@@ -16,22 +16,38 @@ int main() {
 }
 """
 
-CHECKER_CPP: str = """\
+CHECKER_CPP: bytes = b"""\
 /*
 CHECKER:
 * input: input, user output, and expected output (optional), joined with "---"
 * verdict: call checker_ac() if the user output is accepted
            or checker_wa() with the wrong answer reason otherwise
 * output: do not output anything else
+* persistent: add a "// persistent" line below to keep the checker running between testcases,
+              it is then started with --persistent and gets a "===CASE===" line after each testcase,
+              checker_ac() and checker_wa() answer with the reason length on its own line and the reason,
+              so read exactly the testcase in check() instead of reading until the end of the input
 */
 
+bool persistent;
+
+struct verdict_given {};
+
+void checker_verdict(string message) {
+    if (!persistent) {
+        cout << message;
+        exit(0);
+    }
+    cout << message.size() << '\\n' << message << flush;
+    throw verdict_given();
+}
+
 void checker_ac() {
-    exit(0);
+    checker_verdict("");
 }
 
 void checker_wa(string message) {
-    cout << (message != "" ? message : "checker returned wa");
-    exit(0);
+    checker_verdict(message != "" ? message : "checker returned wa");
 }
 
 void assert_io_delim() {
@@ -40,9 +56,7 @@ void assert_io_delim() {
     assert(delim == "---");
 }
 
-int main() {
-    ios::sync_with_stdio(0);
-    cin.tie(0);
+void check() {
     // read input
     
     assert_io_delim();
@@ -51,11 +65,27 @@ int main() {
     assert_io_delim();
     // read expected output (optional)
     
-    return 1;  // checker_ac() should be called before this line
+}
+
+int main(int argc, char* argv[]) {
+    ios::sync_with_stdio(0);
+    cin.tie(0);
+    persistent = argc > 1 && string(argv[1]) == "--persistent";
+    while (true) {
+        try {
+            check();
+            return 1;  // checker_ac() or checker_wa() should be called before this line
+        } catch (verdict_given&) {}
+        string line;
+        while (getline(cin, line) && line != "===CASE===") {}
+        if (cin.peek() == EOF) {
+            return 0;
+        }
+    }
 }
 """
 
-BRUTEFORCE_CPP: str = """\
+BRUTEFORCE_CPP: bytes = b"""\
 /*
 BRUTEFORCE:
 * input: random input
@@ -70,7 +100,7 @@ int main() {
 }
 """
 
-GENERATOR_CPP: str = """\
+GENERATOR_CPP: bytes = b"""\
 /*
 GENERATOR:
 * output: a random input
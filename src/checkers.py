@@ -1,6 +1,12 @@
 '''Implements the checkers for the runners to use.'''
 
 from typing import Protocol, Optional, Literal, ClassVar
+import re
+import os
+import time
+import selectors
+import subprocess
+from threading import Lock
 from enum import IntEnum
 from dataclasses import dataclass
 from paths import File
@@ -8,6 +14,29 @@ import execution
 from execution import Execution
 
 
+# the number of bytes from which the first wrong byte is searched for with numpy arrays
+BYTE_COMPARE_MIN_BYTES = 4096
+
+# matches the whitespace between the tokens of an output
+WHITESPACE_RE = re.compile(rb'\s+')
+
+# the tokens the yes/no checker accepts
+YES_NO_TOKENS: frozenset[bytes] = frozenset({b'yes', b'no'})
+
+# matches lowercased outputs containing only yes/no tokens separated by whitespace
+YES_NO_RE = re.compile(rb'\s*(?:(?:yes|no)(?:\s+(?:yes|no))*\s*)?')
+
+# a line of a custom checker that keeps running and checks the testcases one after another, anywhere in the file
+# since the checker starts with the cpp header
+PERSISTENT_CHECKER_MARKER = '// persistent'
+
+# the line that ends each testcase sent to a persistent custom checker
+PERSISTENT_CHECKER_CASE_DELIM = b'===CASE==='
+
+# the argument a persistent custom checker is started with, so the checker knows to frame its verdicts
+PERSISTENT_CHECKER_ARG = '--persistent'
+
+
 class CheckerResultType(IntEnum):
     '''The result type of the checker.'''
     ACCEPTED = 0  # the output was correct
@@ -16,13 +45,19 @@ class CheckerResultType(IntEnum):
     CHECKER_TIME_LIMIT_EXCEEDED = 3  # checker exceeded the time limit
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckerResult:
     '''The result of the checker.'''
     result_type: CheckerResultType  # the result type of the checker
     wrong_answer_reason: Optional[str]  # the reason why the checker returned WRONG_ANSWER if needed
 
 
+# the results without a wrong answer reason are shared instead of created for every check
+CHECKER_RESULT_ACCEPTED = CheckerResult(CheckerResultType.ACCEPTED, None)
+CHECKER_RESULT_RUNTIME_ERROR = CheckerResult(CheckerResultType.CHECKER_RUNTIME_ERROR, None)
+CHECKER_RESULT_TIME_LIMIT_EXCEEDED = CheckerResult(CheckerResultType.CHECKER_TIME_LIMIT_EXCEEDED, None)
+
+
 class Checker(Protocol):
     '''An immutable checker class.'''
 
@@ -40,6 +75,11 @@ class Checker(Protocol):
         :return: the result of the check
         '''
 
+    def close(self) -> None:
+        '''
+        Release what the checker kept between the checks of a run, called by the runner once the run is over.
+        '''
+
 
 class CheckerTokens(Checker):
     '''Implements the token checker.'''
@@ -66,25 +106,38 @@ class CheckerTokens(Checker):
         :param time_limit: the time limit in seconds, should be a positive number
         :return: the result of the check
         '''
-        expected_tokens = expected_output.split()
-        user_tokens = user_output.split()
+        if expected_output == user_output:  # equal outputs have equal tokens, skip splitting them
+            return CHECKER_RESULT_ACCEPTED
+        return self.check_tokens(join_tokens(expected_output.encode('utf-8')), join_tokens(user_output.encode('utf-8')))
+
+    @staticmethod
+    def check_tokens(expected_tokens: bytes, user_tokens: bytes) -> CheckerResult:
+        '''
+        Check if the user tokens are correct by comparing them to the expected tokens.
+        :param expected_tokens: the expected tokens joined with single spaces
+        :param user_tokens: the user tokens joined with single spaces
+        :return: the result of the check
+        '''
         if expected_tokens == user_tokens:
-            result_type = CheckerResultType.ACCEPTED
-            wrong_answer_reason = None
-        elif len(expected_tokens) != len(user_tokens):
-            result_type = CheckerResultType.WRONG_ANSWER
+            return CHECKER_RESULT_ACCEPTED
+
+        expected_count = count_tokens(expected_tokens)
+        user_count = count_tokens(user_tokens)
+        if expected_count != user_count:
             wrong_answer_reason = (
-                f'expected {len(expected_tokens)} token{'s' if len(expected_tokens) != 1 else ''}, '
-                f'got {len(user_tokens)}'
+                f'expected {expected_count} token{'s' if expected_count != 1 else ''}, got {user_count}'
             )
         else:  # expected_tokens != user_tokens
-            result_type = CheckerResultType.WRONG_ANSWER
-            wrong_token_index = [one != two for one, two in zip(expected_tokens, user_tokens)].index(True)
+            # the tokens before the first wrong byte are equal, so the wrong token starts at the same offset in both
+            wrong_offset = get_wrong_byte_offset(expected_tokens, user_tokens)
+            wrong_token_index = expected_tokens.count(b' ', 0, wrong_offset)
+            wrong_token_start = expected_tokens.rfind(b' ', 0, wrong_offset) + 1
             wrong_answer_reason = (
-                f'expected "{expected_tokens[wrong_token_index]}", got "{user_tokens[wrong_token_index]}" '
+                f'expected "{get_token(expected_tokens, wrong_token_start)}", '
+                f'got "{get_token(user_tokens, wrong_token_start)}" '
                 f'at token {wrong_token_index + 1}'
             )
-        return CheckerResult(result_type, wrong_answer_reason)
+        return CheckerResult(CheckerResultType.WRONG_ANSWER, wrong_answer_reason)
 
 
 class CheckerYesNo(Checker):
@@ -113,17 +166,29 @@ class CheckerYesNo(Checker):
         :param time_limit: the time limit in seconds, should be a positive number
         :return: the result of the check
         '''
+        # yes/no are ascii, so lowercasing the encoded bytes with bytes.lower() is enough
+        user_output_lower = user_output.encode('utf-8').lower()
+
         # check that all tokens in user_output are yes/no
-        user_tokens = user_output.lower().split()
-        for token_number, user_token in enumerate(user_tokens):
-            if user_token not in ['yes', 'no']:
-                return CheckerResult(
-                    CheckerResultType.WRONG_ANSWER,
-                    f'expected "yes"/"no", got "{user_token}" at token {token_number + 1}'
-                )
+        if YES_NO_RE.fullmatch(user_output_lower) is None:
+            # find the first token that isn't yes/no
+            for token_number, user_token in enumerate(user_output_lower.split()):
+                if user_token not in YES_NO_TOKENS:
+                    return CheckerResult(
+                        CheckerResultType.WRONG_ANSWER,
+                        f'expected "yes"/"no", got "{user_token.decode('utf-8', 'replace')}" '
+                        f'at token {token_number + 1}'
+                    )
 
         # call the tokens checker
-        return CheckerTokens().check(io_input, expected_output.lower(), user_output.lower())
+        return CHECKER_TOKENS.check_tokens(
+            join_tokens(expected_output.encode('utf-8').lower()), join_tokens(user_output_lower)
+        )
+
+
+# the stateless checkers are shared instead of created for every check
+CHECKER_TOKENS = CheckerTokens()
+CHECKER_YES_NO = CheckerYesNo()
 
 
 class CheckerCustom(Checker):
@@ -132,6 +197,9 @@ class CheckerCustom(Checker):
     one_char_name: ClassVar[Literal['c']] = 'c'
     checker_file: File  # the checker .cpp file
     checker_file_out: File  # the checker .out file
+    persistent: Optional[bool]  # whether the checker is persistent, None until the first check of a run
+    persistent_process: Optional[subprocess.Popen[bytes]]  # the running persistent checker or None if not started
+    persistent_lock: Lock  # the lock for the persistent checker since the run threads check concurrently
 
     def __init__(self, checker_file: File, checker_file_out: File) -> None:
         '''
@@ -141,6 +209,9 @@ class CheckerCustom(Checker):
         '''
         self.checker_file = checker_file
         self.checker_file_out = checker_file_out
+        self.persistent = None
+        self.persistent_process = None
+        self.persistent_lock = Lock()
 
     def check(self, io_input: str, expected_output: str, user_output: str, time_limit: float) -> CheckerResult:
         '''
@@ -148,34 +219,180 @@ class CheckerCustom(Checker):
         Expects the checker_file to be compiled to checker_file_out.
         The checker_file should output nothing when it determines that the output is accepted
         or the reason why it determined it is wrong answer otherwise (the output should be non-empty in that case).
+        A checker_file with a PERSISTENT_CHECKER_MARKER line, for example right below the cpp header,
+        is started once per run instead, see check_persistent for how it communicates.
         :param io_input: the testcase input
         :param expected_output: the expected output
         :param user_output: the user output
         :param time_limit: the time limit in seconds, should be a positive number
         :return: the result of the check
         '''
-        io_delim = '---'  # join io with a delim to ensure the checker reads the right io
-        run_result = Execution.run(
-            self.checker_file_out,
-            f'\n{io_delim}\n'.join([io_input, user_output, expected_output]),
-            time_limit
+        io_delim = b'---'  # join io with a delim to ensure the checker reads the right io
+        checker_input = (b'\n' + io_delim + b'\n').join(
+            io.encode('utf-8') for io in (io_input, user_output, expected_output)
         )
 
-        result_type: Optional[CheckerResultType] = None
-        wrong_answer_reason: Optional[str] = None
+        with self.persistent_lock:
+            if self.persistent is None:
+                self.persistent = any(
+                    line.strip() == PERSISTENT_CHECKER_MARKER for line in self.checker_file.read_file().splitlines()
+                )
+            if self.persistent:
+                return self.check_persistent(checker_input, time_limit)
+
+        run_result = Execution.run(self.checker_file_out, checker_input, time_limit)
 
         if run_result.result_type == execution.RunResultType.SUCCESS:
             if run_result.output == '':
-                result_type = CheckerResultType.ACCEPTED
+                return CHECKER_RESULT_ACCEPTED
             else:
-                result_type = CheckerResultType.WRONG_ANSWER
-                wrong_answer_reason = run_result.output
+                return CheckerResult(CheckerResultType.WRONG_ANSWER, run_result.output)
         elif run_result.result_type == execution.RunResultType.RUNTIME_ERROR:
-            result_type = CheckerResultType.CHECKER_RUNTIME_ERROR
-        elif run_result.result_type == execution.RunResultType.TIME_LIMIT_EXCEEDED:
-            result_type = CheckerResultType.CHECKER_TIME_LIMIT_EXCEEDED
+            return CHECKER_RESULT_RUNTIME_ERROR
+        else:
+            assert run_result.result_type == execution.RunResultType.TIME_LIMIT_EXCEEDED
+            return CHECKER_RESULT_TIME_LIMIT_EXCEEDED
+
+    def check_persistent(self, checker_input: bytes, time_limit: float) -> CheckerResult:
+        '''
+        Check with the persistent checker, starting it if needed, expects persistent_lock to be held.
+        The checker is started with PERSISTENT_CHECKER_ARG and gets the same input as a one-off checker followed by
+        a PERSISTENT_CHECKER_CASE_DELIM line. It should answer with the byte length of the wrong answer reason
+        on its own line followed by the reason, or with 0 and a newline when the output is accepted,
+        so reasons can have any number of lines.
+        The checker is stopped after a runtime error or time limit exceeded and restarted on the next check.
+        :param checker_input: the input joined with the io delims
+        :param time_limit: the time limit in seconds, should be a positive number
+        :return: the result of the check
+        '''
+        if self.persistent_process is None:
+            self.persistent_process = Execution.start(self.checker_file_out, [PERSISTENT_CHECKER_ARG])
+            assert self.persistent_process.stdin is not None  # started with pipes
+            os.set_blocking(self.persistent_process.stdin.fileno(), False)  # writing is bounded by the time limit
+        process = self.persistent_process
+        assert process.stdin is not None and process.stdout is not None  # started with pipes
+        stdin_fd, stdout_fd = process.stdin.fileno(), process.stdout.fileno()
+
+        # send the testcase and read the verdict within the time limit, a checker not reading its input times out
+        testcase = memoryview(checker_input + b'\n' + PERSISTENT_CHECKER_CASE_DELIM + b'\n')
+        verdict = b''
+        reason_start: Optional[int] = None  # the offset of the reason in verdict once the length line is read
+        verdict_end: Optional[int] = None  # the length of the whole verdict once the length line is read
+        deadline = time.monotonic() + time_limit
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdin_fd, selectors.EVENT_WRITE)
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            while len(testcase) > 0 or verdict_end is None or len(verdict) < verdict_end:
+                remaining_time = deadline - time.monotonic()
+                events = selector.select(remaining_time) if remaining_time > 0 else []
+                if len(events) == 0:
+                    self.stop_persistent()
+                    return CHECKER_RESULT_TIME_LIMIT_EXCEEDED
+                for key, _ in events:
+                    if key.fd == stdin_fd:  # write as much of the testcase as the pipe takes
+                        try:
+                            testcase = testcase[os.write(stdin_fd, testcase):]
+                        except BlockingIOError:  # the pipe filled up again, wait for the next event
+                            continue
+                        except BrokenPipeError:  # the checker exited
+                            self.stop_persistent()
+                            return CHECKER_RESULT_RUNTIME_ERROR
+                        if len(testcase) == 0:
+                            selector.unregister(stdin_fd)
+                    else:
+                        verdict_part = os.read(stdout_fd, 65536)  # the checker only writes the verdict of this case
+                        if verdict_part == b'':  # the checker exited
+                            self.stop_persistent()
+                            return CHECKER_RESULT_RUNTIME_ERROR
+                        verdict += verdict_part
+                        if verdict_end is None and b'\n' in verdict:
+                            length_line = verdict[:verdict.index(b'\n')]
+                            if not length_line.isdigit():  # not a verdict
+                                self.stop_persistent()
+                                return CHECKER_RESULT_RUNTIME_ERROR
+                            reason_start = len(length_line) + 1
+                            verdict_end = reason_start + int(length_line)
+                        if verdict_end is not None and len(verdict) >= verdict_end:
+                            selector.unregister(stdout_fd)
+
+        if len(verdict) > verdict_end:  # output after the verdict would be read as the next verdict
+            self.stop_persistent()
+            return CHECKER_RESULT_RUNTIME_ERROR
+        wrong_answer_reason = verdict[reason_start:].decode('utf-8', 'replace')
+        if wrong_answer_reason == '':
+            return CHECKER_RESULT_ACCEPTED
+        return CheckerResult(CheckerResultType.WRONG_ANSWER, wrong_answer_reason)
+
+    def stop_persistent(self) -> None:
+        '''
+        Stop the persistent checker if it is running.
+        '''
+        if self.persistent_process is not None:
+            self.persistent_process.kill()
+            self.persistent_process.communicate()  # wait for it to exit and close the pipes
+            self.persistent_process = None
+
+    def close(self) -> None:
+        '''
+        Stop the persistent checker and forget whether the checker is persistent since it can change between runs.
+        '''
+        with self.persistent_lock:
+            self.stop_persistent()
+            self.persistent = None
+
+
+def join_tokens(output: bytes) -> bytes:
+    '''
+    Join the tokens of the output with single spaces without creating an object for every token.
+    :param output: the output
+    :return: the tokens of the output joined with single spaces
+    '''
+    return WHITESPACE_RE.sub(b' ', output.strip())
+
+
+def count_tokens(tokens: bytes) -> int:
+    '''
+    Count the tokens joined with single spaces.
+    :param tokens: the tokens joined with single spaces
+    :return: the number of tokens
+    '''
+    return tokens.count(b' ') + 1 if tokens != b'' else 0
+
+
+def get_token(tokens: bytes, token_start: int) -> str:
+    '''
+    Get the token starting at the given offset.
+    :param tokens: the tokens joined with single spaces
+    :param token_start: the offset of the first byte of the token
+    :return: the token
+    '''
+    token_end = tokens.find(b' ', token_start)
+    return tokens[token_start:token_end if token_end != -1 else len(tokens)].decode('utf-8', 'replace')
+
+
+def get_wrong_byte_offset(expected_bytes: bytes, user_bytes: bytes) -> int:
+    '''
+    Get the offset of the first wrong byte, comparing numpy arrays for long outputs.
+    :param expected_bytes: the expected bytes
+    :param user_bytes: the user bytes, not equal to the expected bytes
+    :return: the offset of the first wrong byte, the length of the shorter bytes when it is a prefix of the other
+    '''
+    common_len = min(len(expected_bytes), len(user_bytes))
+
+    # stop at the first wrong byte without building arrays for short outputs
+    if common_len < BYTE_COMPARE_MIN_BYTES:
+        return next(
+            (offset for offset, (expected_byte, user_byte) in enumerate(zip(expected_bytes, user_bytes))
+             if expected_byte != user_byte),
+            common_len
+        )
 
-        return CheckerResult(result_type, wrong_answer_reason)
+    import numpy as np  # imported here so startup and short outputs do not pay for loading numpy
+    differs = np.not_equal(
+        np.frombuffer(expected_bytes, dtype=np.uint8, count=common_len),
+        np.frombuffer(user_bytes, dtype=np.uint8, count=common_len)
+    )
+    return int(differs.argmax()) if differs.any() else common_len  # no difference when one is a prefix
 
 
 def get_checker(one_char_name: Literal['t', 'y', 'c'],
@@ -188,9 +405,9 @@ def get_checker(one_char_name: Literal['t', 'y', 'c'],
     :return: the checker
     '''
     if one_char_name == CheckerTokens.one_char_name:
-        return CheckerTokens()
+        return CHECKER_TOKENS
     elif one_char_name == CheckerYesNo.one_char_name:
-        return CheckerYesNo()
+        return CHECKER_YES_NO
     elif one_char_name == CheckerCustom.one_char_name:
         assert checker_file is not None and checker_file_out is not None
         return CheckerCustom(checker_file, checker_file_out)
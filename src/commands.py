@@ -1,7 +1,6 @@
 '''Implements the command class.'''
 
 from typing import Generic, TypeVar, Optional
-from more_itertools import split_before
 from messages import Messages
 from arguments import Argument, PositionalArgument, OptionalArgument
 
@@ -11,14 +10,22 @@ T = TypeVar('T')
 
 class Command(Generic[T]):
     '''An immutable command class.'''
+    __slots__ = (
+        'short_name', 'long_name', 'command', 'positional_arguments', 'optional_arguments', 'mutually_exclusive',
+        'message', 'help_str', 'positional_help', 'optional_help', 'help_str_pairs', 'flag_indices'
+    )
     short_name: str  # the short name of the command
     long_name: str  # the long name of the command
     command: T  # the command's enum
-    positional_arguments: list[PositionalArgument]  # positional arguments
-    optional_arguments: list[OptionalArgument]  # optional arguments
+    positional_arguments: tuple[PositionalArgument, ...]  # positional arguments
+    optional_arguments: tuple[OptionalArgument, ...]  # optional arguments
     mutually_exclusive: bool  # are optional arguments mutually exclusive
     message: Messages  # the message object that handles printing
     help_str: list[str]  # the help string, odd indices contain short names or short flags of arguments
+    positional_help: list[tuple[str, str]]  # (short name, num args) of positional arguments for help strings
+    optional_help: list[tuple[str, str, str]]  # (short name, flag, num args) of optional arguments for help strings
+    help_str_pairs: list[tuple[str, str]]  # the help string with (text, '') and (short name or flag, arg type) pairs
+    flag_indices: dict[str, int]  # the short and long flags of optional arguments mapped to their indices
 
     def __init__(self, short_name: str, long_name: str, command: T, positional_arguments: list[PositionalArgument],
                  optional_arguments: list[OptionalArgument], mutually_exclusive: bool,
@@ -37,11 +44,31 @@ class Command(Generic[T]):
         self.short_name = short_name
         self.long_name = long_name
         self.command = command
-        self.positional_arguments = positional_arguments
-        self.optional_arguments = optional_arguments
+        self.positional_arguments = tuple(positional_arguments)
+        self.optional_arguments = tuple(optional_arguments)
         self.mutually_exclusive = mutually_exclusive
         self.message = message
         self.help_str = help_str
+        self.positional_help = [
+            (argument.get_name_short(), str(argument.num_args)) for argument in self.positional_arguments
+        ]
+        self.optional_help = [
+            (argument.get_name_short(), argument.short_flag, str(argument.num_args))
+            for argument in self.optional_arguments
+        ]
+        arg_types: dict[str, str] = (  # the arg type of each short name and 'f' for flags
+            {short_name: num_args for short_name, num_args in self.positional_help}
+            | {short_name: num_args for short_name, _, num_args in self.optional_help}
+            | {flag: 'f' for _, flag, _ in self.optional_help}
+        )
+        self.help_str_pairs = [
+            (help_str_part, '') if idx % 2 == 0 else (help_str_part, arg_types[help_str_part])
+            for idx, help_str_part in enumerate(self.help_str)
+        ]
+        self.flag_indices = {}
+        for idx, optional_argument in enumerate(self.optional_arguments):
+            self.flag_indices[optional_argument.short_flag] = idx
+            self.flag_indices[optional_argument.long_flag] = idx
 
         # check that all dict_name values are distinct
         assert (len({argument.dict_name for argument in self.positional_arguments} |
@@ -55,27 +82,41 @@ class Command(Generic[T]):
         '''
         return ', '.join([self.short_name, self.long_name])
 
-    def parse(self, args: list[str]) -> Optional[dict[str, str]]:
+    def parse(self, args: list[str], start: int = 0) -> Optional[dict[str, str]]:
         '''
         Parse the arguments.
         :param args: the given arguments
+        :param start: the index of the first argument to parse, the args before it are skipped
         :return: the dict of parsed arguments (dict_name, value) if successfully parsed or None otherwise
         '''
+        # the attributes used by the nested functions as locals
+        positional_arguments = self.positional_arguments
+        optional_arguments = self.optional_arguments
+        flag_indices = self.flag_indices
+        message = self.message
+        name = self.get_name()
+        mutually_exclusive = self.mutually_exclusive
+
         parsed_args: dict[str, str] = {}
         positional_index = 0  # the next positional argument to parse
-        optional_parsed: list[bool] = [False for _ in self.optional_arguments]  # which optional arguments were parsed
+        optional_parsed = 0  # bitmask of parsed optional arguments, bit i is set when argument i was parsed
 
-        def process_argument(argument: Argument, args_given: Optional[list[str]]) -> tuple[int, bool]:
+        def process_argument(argument: Argument, args_given: Optional[list[str]],
+                             start: int = 0, end: Optional[int] = None) -> tuple[int, bool]:
             '''
             Process the argument with given args.
             :param argument: the argument
             :param args_given: the given args or None when an optional argument isn't given
+            :param start: the index of the first given arg for the argument
+            :param end: the index after the last given arg for the argument, None for the end of args_given
             :return: a tuple with the number of parsed args
                      and a bool True if the argument was parsed successfully, False otherwise
             '''
             if args_given is not None:
-                num_args = argument.get_num_args(len(args_given))
-                parsed_arg = argument.parse(args_given[:num_args])
+                if end is None:
+                    end = len(args_given)
+                num_args = argument.get_num_args(end - start)
+                parsed_arg = argument.parse(args_given[start:start + num_args])
             else:
                 num_args = 0
                 parsed_arg = argument.parse(None)
@@ -85,99 +126,97 @@ class Command(Generic[T]):
             else:
                 return num_args, False
 
-        def process_positional_args(positional_args: list[str]) -> bool:
+        def process_positional_args(start: int, end: int) -> bool:
             '''
             Process the current subset of positional arguments.
-            :param positional_args: the current subset of positional arguments to parse
+            :param start: the index of the first arg of the current subset in args
+            :param end: the index after the last arg of the current subset in args
             :return: True if the positional arguments were successfully parsed, False otherwise
             '''
             nonlocal positional_index
 
-            while len(positional_args) > 0:
+            cursor = start  # the next arg to parse
+            while cursor < end:
                 # check that there's still positional arguments to parse
-                if positional_index >= len(self.positional_arguments):
-                    self.message.command_too_many_positional_args(self.get_name(), positional_args[0])
+                if positional_index >= len(positional_arguments):
+                    message.command_too_many_positional_args(name, args[cursor])
                     return False
 
                 # get the current positional argument
-                positional_argument = self.positional_arguments[positional_index]
+                positional_argument = positional_arguments[positional_index]
                 positional_index += 1
 
                 # parse the args
-                num_parsed, success = process_argument(positional_argument, positional_args)
+                num_parsed, success = process_argument(positional_argument, args, cursor, end)
                 if not success:
                     return False
-                positional_args = positional_args[num_parsed:]  # remove the parsed args
+                cursor += num_parsed  # skip the parsed args
 
             return True
 
-        def get_optional_argument(flag: str) -> Optional[int]:
-            '''
-            Get the index of the optional argument with the given flag.
-            :param flag: the flag given
-            :return: the index of the optional argument or None if none of the arguments matches the flag
-            '''
-            for idx, optional_argument in enumerate(self.optional_arguments):
-                if optional_argument.short_flag == flag or optional_argument.long_flag == flag:
-                    return idx
-            return None
-
-        def process_optional_group(optional_args_group: list[str]) -> bool:
+        def process_optional_group(start: int, end: int) -> bool:
             '''
             Process the current optional group.
-            :param optional_args_group: the optional group of args, first arg must be a positional argument flag
+            :param start: the index of the first arg of the optional group in args, must be an optional argument flag
+            :param end: the index after the last arg of the optional group in args
             :return: True if the optional group is successfully parsed, False otherwise
             '''
+            nonlocal optional_parsed
+
             # parse the optional argument
-            optional_idx = get_optional_argument(optional_args_group[0])
+            optional_idx = flag_indices.get(args[start])  # None if no argument has the flag
             if optional_idx is None:
-                self.message.command_flag_is_not_optional_argument(self.get_name(), optional_args_group[0])
+                message.command_flag_is_not_optional_argument(name, args[start])
                 return False
-            optional_args_group = optional_args_group[1:]  # remove the flag
-            optional_argument = self.optional_arguments[optional_idx]
-            if optional_parsed[optional_idx]:
-                self.message.command_repeated_optional_argument(self.get_name(), optional_argument.get_name_long())
+            start += 1  # skip the flag
+            optional_argument = optional_arguments[optional_idx]
+            if optional_parsed & (1 << optional_idx):
+                message.command_repeated_optional_argument(name, optional_argument.get_name_long())
                 return False
-            if optional_parsed.count(True) == 1 and self.mutually_exclusive:
-                self.message.command_too_many_optional_arguments_mutually_exclusive(self.get_name())
+            if optional_parsed != 0 and mutually_exclusive:
+                message.command_too_many_optional_arguments_mutually_exclusive(name)
                 return False
-            optional_parsed[optional_idx] = True
-            num_parsed, success = process_argument(optional_argument, optional_args_group)
+            optional_parsed |= 1 << optional_idx
+            num_parsed, success = process_argument(optional_argument, args, start, end)
             if not success:
                 return False
 
             # parse the rest as positional args
-            if not process_positional_args(optional_args_group[num_parsed:]):
+            if not process_positional_args(start + num_parsed, end):
                 return False
             return True
 
         # parse the args
         # group by optional arguments, e.g. [['a', 'b'], ['-n', 'c'], ['-m', 'd', 'e'], ['-q']]
-        grouped_args = list(split_before(args, lambda arg: OptionalArgument.is_flag(arg)))
+        # by finding where the groups starting with a flag start in a single pass
+        is_flag = OptionalArgument.is_flag
+        flag_positions = [idx for idx in range(start, len(args)) if is_flag(args[idx])]
 
         # args start with only positional arguments, process the first group
-        if len(args) > 0 and not OptionalArgument.is_flag(args[0]):
-            if not process_positional_args(grouped_args[0]):
+        first_flag_position = flag_positions[0] if len(flag_positions) > 0 else len(args)
+        if first_flag_position > start:
+            if not process_positional_args(start, first_flag_position):
                 return None
-            grouped_args = grouped_args[1:]
 
         # all remaining groups now have an optional argument as the first arg
-        for arg_group in grouped_args:
-            if not process_optional_group(arg_group):
+        for group_start, group_end in zip(flag_positions, flag_positions[1:] + [len(args)]):
+            if not process_optional_group(group_start, group_end):
                 return None
 
         # parse the remaining arguments
         # positional arguments get no args
-        for remaining_positional_argument in self.positional_arguments[positional_index:]:
-            _, remaining_success = process_argument(remaining_positional_argument, [])
-            if not remaining_success:
-                return None
-        # optional arguments get None
-        for optional_index, remaining_optional_argument in enumerate(self.optional_arguments):
-            if not optional_parsed[optional_index]:
-                _, remaining_success = process_argument(remaining_optional_argument, None)
+        if positional_index < len(positional_arguments):
+            for remaining_positional_argument in positional_arguments[positional_index:]:
+                _, remaining_success = process_argument(remaining_positional_argument, [])
                 if not remaining_success:
                     return None
+        # optional arguments get None
+        if optional_parsed != (1 << len(optional_arguments)) - 1:
+            for optional_index, remaining_optional_argument in enumerate(optional_arguments):
+                if not optional_parsed & (1 << optional_index):
+                    _, remaining_success = process_argument(remaining_optional_argument, None)
+                    if not remaining_success:
+                        return None
 
         return parsed_args
 
@@ -189,12 +228,9 @@ class Command(Generic[T]):
         '''
         self.message.command_help_str(
             self.get_name(),
-            [(argument.get_name_short(), str(argument.num_args)) for argument in self.positional_arguments],
-            [
-                (argument.get_name_short(), argument.short_flag, str(argument.num_args))
-                for argument in self.optional_arguments
-            ],
-            self.help_str,
+            self.positional_help,
+            self.optional_help,
+            self.help_str_pairs,
             self.mutually_exclusive
         )
 
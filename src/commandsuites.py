@@ -1,7 +1,9 @@
 '''Implements command suites.'''
 
 import math
+import functools
 from typing import Optional, Protocol, TypeVar
+from types import MappingProxyType
 from enum import IntEnum
 from arguments import PositionalArgument, PositionalArgumentMode, OptionalArgument, OptionalArgumentMode
 from commands import Command
@@ -12,30 +14,65 @@ from aliases import Aliases
 
 T = TypeVar('T')
 
+# the choices shared by the arguments using them, never modified
+FILE_CHOICES: list[str] = ['m', 'c', 'b', 'g']  # main, checker, bruteforce, generator
+MULTITEST_MODE_CHOICES: list[str] = ['o', 'm']  # one, multiple
+CHECKER_CHOICES: list[str] = ['t', 'y', 'c']  # tokens, yes/no, custom
+
+# the range of time limits and timeouts in seconds, shared by the arguments using it
+TIME_RANGE: tuple[float, float] = (0.1, math.inf)
+
+# the short and long names of all commands in order, the help command choices together with the aliases
+COMMAND_NAMES_PROBLEM: tuple[str, ...] = (
+    'e', 'edit', 'c', 'custom-invocation', 'r', 'run', 's', 'set', 'io', 'input-output', 'n', 'random',
+    'p', 'paste', 'm', 'move', 'a', 'alias', 'h', 'help', 'q', 'quit'
+)
+COMMAND_NAMES_PARSER: tuple[str, ...] = ('cf', 'codeforces', 'c', 'config', 'a', 'alias', 'h', 'help', 'q', 'quit')
+
 
 class CommandSuite(Protocol[T]):
     '''An immutable command suite defining commands.'''
-    all_commands: list[Command[T]]  # the list of commands
-    command_names: dict[str, Command[T]]  # the dict of command names to commands
+    __slots__ = ()  # no instance dict for the command suites
+    all_commands: tuple[Command[T], ...]  # the commands
+    command_names: MappingProxyType[str, Command[T]]  # the read-only dict of command names to commands
+    command_first_chars: frozenset[str]  # the first chars of command and alias names, to reject others without a lookup
+    resolved_names: dict[str, tuple[Command[T], tuple[str, ...]]]  # names to (command, alias args or ())
     message: Messages  # the message object that handles printing
     config: Configs  # the configs object storing configs
     alias: Aliases  # the aliases
 
+    def set_resolved_names(self) -> None:
+        '''
+        Set the dict of command and alias names to their command and alias args, and their first chars.
+        Must be called after command_names is set and whenever the aliases change.
+        '''
+        self.resolved_names = {command_name: (command, ()) for command_name, command in self.command_names.items()}
+        for alias_name in self.alias.get_alias_names():
+            alias_args = self.alias.get_alias_args(alias_name)
+            command = self.command_names.get(alias_args[0]) if len(alias_args) > 0 else None
+            if command is not None:  # aliases not to a command are left out and reported by parse
+                self.resolved_names[alias_name] = (command, alias_args)
+        self.command_first_chars = frozenset(name[0] for name in self.resolved_names)
+
     def group_args(self, args: str) -> Optional[list[str]]:
         '''
         Process the args str by grouping args by double quotes and spaces.
         :param args: the user inputted args
         :return: the list of args grouped by double quotes and spaces if parsed successfully or None otherwise
         '''
-        # check even number of double quotes
-        if args.count('"') % 2 == 1:
-            self.message.command_suite_odd_number_double_quotes()
-            return None
+        # no double quotes, the args are only split by space
+        if '"' not in args:
+            return args.split()
 
         # input inside double quotes is kept as is, input outside is also split by space
         quote_grouped: list[str] = args.split('"')
         args_list: list[str] = []
 
+        # check even number of double quotes, splitting by n double quotes gives n + 1 parts
+        if len(quote_grouped) % 2 == 0:
+            self.message.command_suite_odd_number_double_quotes()
+            return None
+
         for idx, quote_part in enumerate(quote_grouped):
             if idx % 2 == 1:  # inside quotes
                 args_list.append(quote_part)
@@ -65,23 +102,30 @@ class CommandSuite(Protocol[T]):
         if args is None:
             return None
 
-        # no command given
-        if len(args) == 0:
+        # no command given, also when the first arg is an empty quoted arg
+        if len(args) == 0 or args[0] == '':
             self.message.command_suite_no_command_given()
             return None
 
-        # check for an alias
-        if args[0] in self.alias:
-            args = self.alias[args[0]].split() + args[1:]
+        # the command and alias args of a command or an alias, looked up once
+        resolved = self.resolved_names.get(args[0]) if args[0][:1] in self.command_first_chars else None
 
-        # no command with that name
-        if args[0] not in self.command_names:
-            self.message.command_suite_not_a_command(args[0])
+        # no command with that name, also for an alias not to a command
+        if resolved is None:
+            not_a_command = args[0]
+            if args[0] in self.alias:
+                alias_args = self.alias.get_alias_args(args[0])
+                not_a_command = alias_args[0] if len(alias_args) > 0 else ''
+            self.message.command_suite_not_a_command(not_a_command)
             return None
 
+        # expand an alias, the command name stays at index 0
+        command, alias_args = resolved
+        if len(alias_args) > 0:
+            args = [*alias_args, *args[1:]]
+
         # parse the args
-        command = self.command_names[args[0]]
-        parsed_args = command.parse(args[1:])
+        parsed_args = command.parse(args, 1)  # skip the command name without copying the args
         if parsed_args is not None:
             return command.command, parsed_args
         else:
@@ -97,8 +141,9 @@ class CommandSuite(Protocol[T]):
             for command in self.all_commands:
                 command.print_help_str_short()
         else:
-            if command_name in self.command_names:
-                self.command_names[command_name].print_help_str_long()
+            command = self.command_names.get(command_name)  # looked up once, None for aliases
+            if command is not None:
+                command.print_help_str_long()
             elif command_name in self.alias:
                 self.alias.print_help_strings(command_name)
             else:
@@ -125,18 +170,19 @@ class CommandSuite(Protocol[T]):
                     self.message.alias_failed(alias_args[0] if len(alias_args) >= 1 else None)
                 # alias successful
                 else:
-                    self.alias.add_alias(alias_name, ' '.join(alias_args))
-                    self.message.aliased_successfully(alias_name, self.alias[alias_name])
+                    alias_str = self.alias.add_alias(alias_name, alias_args)
+                    self.set_resolved_names()
+                    self.message.aliased_successfully(alias_name, alias_str)
 
             # unalias
             else:
+                # unalias successful, the alias is looked up once by removing it
+                if len(alias_args) == 0 and self.alias.remove_alias(alias_name):
+                    self.set_resolved_names()
+                    self.message.unalised_successfully(alias_name)
                 # unalias failed
-                if alias_name not in self.alias or len(alias_args) >= 1:
-                    self.message.unalias_failed(alias_name, len(alias_args) >= 1)
-                # unalias successful
                 else:
-                    self.alias.remove_alias(alias_name)
-                    self.message.unalised_successfully(alias_name)
+                    self.message.unalias_failed(alias_name, len(alias_args) >= 1)
 
         # command was not given
         else:
@@ -160,8 +206,11 @@ class CommandsProblem(IntEnum):
 
 class CommandSuiteProblem(CommandSuite[CommandsProblem]):
     '''An immutable command suite for problems.'''
-    all_commands: list[Command[CommandsProblem]]  # the list of commands
-    command_names: dict[str, Command[CommandsProblem]]  # the dict of command names to commands
+    __slots__ = ('all_commands', 'command_names', 'command_first_chars', 'resolved_names', 'message', 'config', 'alias')
+    all_commands: tuple[Command[CommandsProblem], ...]  # the commands
+    command_names: MappingProxyType[str, Command[CommandsProblem]]  # the read-only dict of command names to commands
+    command_first_chars: frozenset[str]  # the first chars of command and alias names, to reject others without a lookup
+    resolved_names: dict[str, tuple[Command[CommandsProblem], tuple[str, ...]]]  # names to (command, alias args or ())
     message: Messages  # the message object that handles printing
     config: Configs  # the configs object storing configs
     alias: Aliases  # the aliases
@@ -180,7 +229,8 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
         self.message = message
         self.config = config
         self.alias = Aliases(self.config.aliases_problem, self.message)
-        problem_ids = [problem_id.lower() for problem_id in problem_ids]
+        if not all(problem_id.islower() for problem_id in problem_ids):  # skip if the caller already lowercased them
+            problem_ids = [problem_id.lower() for problem_id in problem_ids]
 
         # edit command
         # e, edit problems[*] [--all] [-f file]
@@ -201,7 +251,7 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
             1, OptionalArgumentMode.CHOICES, self.message,
             'the file to edit, one of "m" for main, "c" for checker, "b" for bruteforce, or "g" for generator',
             ['m'],
-            choices=['m', 'c', 'b', 'g']
+            choices=FILE_CHOICES
         )
         command_edit = Command(
             'e', 'edit', CommandsProblem.EDIT,
@@ -215,109 +265,15 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
              ]
         )
 
-        # custom invocation command
-        # c, custom-invocation [-f file]
-        arg_custom_invocation_file = OptionalArgument(
-            '-f', '--file', 'file',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the file to run, one of "m" for main, "c" for checker, "b" for bruteforce, or "g" for generator',
-            ['m'],
-            choices=['m', 'c', 'b', 'g']
-        )
-        command_custom_invocation = Command(
-            'c', 'custom-invocation', CommandsProblem.CUSTOM_INVOCATION,
-            [], [arg_custom_invocation_file], False,
-            self.message,
-            [
-                'Run a .cpp file in a new shell. When', arg_custom_invocation_file.short_flag,
-                'is not given, run main, otherwise run', arg_custom_invocation_file.get_name_short(), '.'
-            ]
-        )
-
-        # run command
-        # r, run [-t tl] [-m multitest-mode] [-c checker] [-n]
-        arg_run_time_limit = OptionalArgument(
-            '-t', '--time-limit', 'time-limit',
-            1, OptionalArgumentMode.FLOAT_RANGE, self.message,
-            'the time limit',
-            None,
-            num_range=(0.1, math.inf)
-        )
-        arg_run_multitest_mode = OptionalArgument(
-            '-m', '--multitest-mode', 'multitest-mode',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the multitest mode to use, one of "o" for entire testcases or "m" for multitests',
-            None,
-            choices=['o', 'm']
-        )
-        arg_run_checker = OptionalArgument(
-            '-c', '--checker', 'checker',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the checker to use, one of "t" for tokenize (compare tokens without whitespace), '
-            '"y" for yes/no checker (case-insensitive), or "c" for custom checker',
-            None,
-            choices=['t', 'y', 'c']
-        )
-        arg_run_no_override = OptionalArgument(
-            '-n', '--no-override', 'no-override',
-            0, OptionalArgumentMode.BOOL_FLAG, self.message,
-            'when set, the selected options and modes aren\'t overridden',
-            ['False']
-        )
-        command_run = Command(
-            'r', 'run', CommandsProblem.RUN,
-            [], [
-                arg_run_time_limit, arg_run_multitest_mode, arg_run_checker, arg_run_no_override
-            ], False,
-            self.message,
-            [
-                'Run the testcases. When', arg_run_time_limit.short_flag, 'is given, set the time limit to',
-                arg_run_time_limit.get_name_short(), '. When', arg_run_multitest_mode.short_flag,
-                'is given, set the multitest mode to', arg_run_multitest_mode.get_name_short(),
-                '. When', arg_run_checker.short_flag, 'is given, set the checker to', arg_run_checker.get_name_short(),
-                '. Unless', arg_run_no_override.short_flag,
-                'is set, override the default problem options and modes with the given ones.'
-            ]
-        )
-
-        # set command
-        # s, set [-t tl] [-m multitest-mode] [-c checker]
-        arg_set_time_limit = OptionalArgument(
-            '-t', '--time-limit', 'time-limit',
-            1, OptionalArgumentMode.FLOAT_RANGE, self.message,
-            'the time limit',
-            None,
-            num_range=(0.1, math.inf)
-        )
-        arg_set_multitest_mode = OptionalArgument(
-            '-m', '--multitest-mode', 'multitest-mode',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the multitest mode to use, one of "o" for entire testcases or "m" for multitests',
-            None,
-            choices=['o', 'm']
-        )
-        arg_set_checker = OptionalArgument(
-            '-c', '--checker', 'checker',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the checker to use, one of "t" for tokenize (compare tokens without whitespace), '
-            '"y" for yes/no checker (case-insensitive), or "c" for custom checker',
-            None,
-            choices=['t', 'y', 'c']
-        )
-        command_set = Command(
-            's', 'set', CommandsProblem.SET,
-            [], [
-                arg_set_time_limit, arg_set_multitest_mode, arg_set_checker
-            ], False,
-            self.message,
-            [
-                'Set the default options and modes of the problem. When', arg_set_time_limit.short_flag,
-                'is given, set the time limit to', arg_set_time_limit.get_name_short(),
-                '. When', arg_set_multitest_mode.short_flag, 'is given, set the multitest mode to',
-                arg_set_multitest_mode.get_name_short(), '. When', arg_set_checker.short_flag,
-                'is given, set the checker to', arg_set_checker.get_name_short(), '.'
-            ]
-        )
+        # the commands that don't depend on the problem
+        static_commands = self.get_static_commands(self.message)
+        command_custom_invocation = static_commands[CommandsProblem.CUSTOM_INVOCATION]
+        command_run = static_commands[CommandsProblem.RUN]
+        command_set = static_commands[CommandsProblem.SET]
+        command_random = static_commands[CommandsProblem.RANDOM]
+        command_paste = static_commands[CommandsProblem.PASTE]
+        command_alias = static_commands[CommandsProblem.ALIAS]
+        command_quit = static_commands[CommandsProblem.QUIT]
 
         # input output command
         # io, input-output [-r rm_cnt | -k keep_cnt | --multitests tc? | --add | -e tc | --view tc?]
@@ -384,47 +340,191 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
             ]
         )
 
+        # move command
+        # m, move problem
+        arg_move_problem = PositionalArgument(
+            'problem-id', 'problem-id',
+            1, PositionalArgumentMode.CHOICES, self.message,
+            f'problem id to move to, one of {problem_ids}',
+            choices=problem_ids
+        )
+        command_move = Command(
+            'm', 'move', CommandsProblem.MOVE,
+            [arg_move_problem], [], False,
+            self.message,
+            [
+                'Move to the problem', arg_move_problem.get_name_short(), '.'
+            ]
+        )
+
+        # help command
+        # h, help command[?]
+        arg_help_command = PositionalArgument(
+            'command', 'command',
+            '?', PositionalArgumentMode.CHOICES, self.message,
+            'the command to display help for if specified or all otherwise',
+            choices=[*COMMAND_NAMES_PROBLEM, *self.alias.get_alias_names()]
+        )
+        command_help = Command(
+            'h', 'help', CommandsProblem.HELP,
+            [arg_help_command], [], False,
+            self.message,
+            [
+                'If', arg_help_command.get_name_short(), 'is not given, show short help strings for all commands. '
+                'Otherwise, show long help string for', arg_help_command.get_name_short(), '.'
+            ]
+        )
+
+        # set all_commands
+        self.all_commands = (
+            command_edit,
+            command_custom_invocation,
+            command_run,
+            command_set,
+            command_input_output,
+            command_random,
+            command_paste,
+            command_move,
+            command_alias,
+            command_help,
+            command_quit
+        )
+
+        # set command_names
+        self.command_names = MappingProxyType({
+            command_name: command
+            for command in self.all_commands
+            for command_name in (command.short_name, command.long_name)
+        })
+        assert tuple(self.command_names) == COMMAND_NAMES_PROBLEM  # the help command lists all commands
+        self.set_resolved_names()
+
+    @staticmethod
+    @functools.cache
+    def get_static_commands(message: Messages) -> dict[CommandsProblem, Command[CommandsProblem]]:
+        '''
+        Get the commands that don't depend on the problem, built once per message object and shared by all instances.
+        :param message: the message object that handles printing
+        :return: the dict of commands to the static commands
+        '''
+
+        # custom invocation command
+        # c, custom-invocation [-f file]
+        arg_custom_invocation_file = OptionalArgument(
+            '-f', '--file', 'file',
+            1, OptionalArgumentMode.CHOICES, message,
+            'the file to run, one of "m" for main, "c" for checker, "b" for bruteforce, or "g" for generator',
+            ['m'],
+            choices=FILE_CHOICES
+        )
+        command_custom_invocation = Command(
+            'c', 'custom-invocation', CommandsProblem.CUSTOM_INVOCATION,
+            [], [arg_custom_invocation_file], False,
+            message,
+            [
+                'Run a .cpp file in a new shell. When', arg_custom_invocation_file.short_flag,
+                'is not given, run main, otherwise run', arg_custom_invocation_file.get_name_short(), '.'
+            ]
+        )
+
+        # the arguments shared by run and set, the checker is also shared by random
+        arg_time_limit = OptionalArgument(
+            '-t', '--time-limit', 'time-limit',
+            1, OptionalArgumentMode.FLOAT_RANGE, message,
+            'the time limit',
+            None,
+            num_range=TIME_RANGE
+        )
+        arg_multitest_mode = OptionalArgument(
+            '-m', '--multitest-mode', 'multitest-mode',
+            1, OptionalArgumentMode.CHOICES, message,
+            'the multitest mode to use, one of "o" for entire testcases or "m" for multitests',
+            None,
+            choices=MULTITEST_MODE_CHOICES
+        )
+        arg_checker = OptionalArgument(
+            '-c', '--checker', 'checker',
+            1, OptionalArgumentMode.CHOICES, message,
+            'the checker to use, one of "t" for tokenize (compare tokens without whitespace), '
+            '"y" for yes/no checker (case-insensitive), or "c" for custom checker',
+            None,
+            choices=CHECKER_CHOICES
+        )
+
+        # run command
+        # r, run [-t tl] [-m multitest-mode] [-c checker] [-n]
+        arg_run_no_override = OptionalArgument(
+            '-n', '--no-override', 'no-override',
+            0, OptionalArgumentMode.BOOL_FLAG, message,
+            'when set, the selected options and modes aren\'t overridden',
+            ['False']
+        )
+        command_run = Command(
+            'r', 'run', CommandsProblem.RUN,
+            [], [
+                arg_time_limit, arg_multitest_mode, arg_checker, arg_run_no_override
+            ], False,
+            message,
+            [
+                'Run the testcases. When', arg_time_limit.short_flag, 'is given, set the time limit to',
+                arg_time_limit.get_name_short(), '. When', arg_multitest_mode.short_flag,
+                'is given, set the multitest mode to', arg_multitest_mode.get_name_short(),
+                '. When', arg_checker.short_flag, 'is given, set the checker to', arg_checker.get_name_short(),
+                '. Unless', arg_run_no_override.short_flag,
+                'is set, override the default problem options and modes with the given ones.'
+            ]
+        )
+
+        # set command
+        # s, set [-t tl] [-m multitest-mode] [-c checker]
+        command_set = Command(
+            's', 'set', CommandsProblem.SET,
+            [], [
+                arg_time_limit, arg_multitest_mode, arg_checker
+            ], False,
+            message,
+            [
+                'Set the default options and modes of the problem. When', arg_time_limit.short_flag,
+                'is given, set the time limit to', arg_time_limit.get_name_short(),
+                '. When', arg_multitest_mode.short_flag, 'is given, set the multitest mode to',
+                arg_multitest_mode.get_name_short(), '. When', arg_checker.short_flag,
+                'is given, set the checker to', arg_checker.get_name_short(), '.'
+            ]
+        )
+
         # random command
         # n, random num [-t tl] [-c checker] [-s total-timeout]
         arg_random_num = PositionalArgument(
             'num', 'num',
-            1, PositionalArgumentMode.INT_RANGE, self.message,
+            1, PositionalArgumentMode.INT_RANGE, message,
             'the number of testcases to run',
             num_range=(1, 10000)
         )
         arg_random_time_limit = OptionalArgument(
             '-t', '--time-limit', 'time-limit',
-            1, OptionalArgumentMode.FLOAT_RANGE, self.message,
+            1, OptionalArgumentMode.FLOAT_RANGE, message,
             'the time limit for each testcase',
             None,
-            num_range=(0.1, math.inf)
-        )
-        arg_random_checker = OptionalArgument(
-            '-c', '--checker', 'checker',
-            1, OptionalArgumentMode.CHOICES, self.message,
-            'the checker to use, one of "t" for tokenize (compare tokens without whitespace), '
-            '"y" for yes/no checker (case-insensitive), or "c" for custom checker',
-            None,
-            choices=['t', 'y', 'c']
+            num_range=TIME_RANGE
         )
         arg_random_total_timeout = OptionalArgument(
             '-s', '--total-timeout', 'total-timeout',
-            1, OptionalArgumentMode.FLOAT_RANGE, self.message,
+            1, OptionalArgumentMode.FLOAT_RANGE, message,
             'the total timeout for the random command',
             None,
-            num_range=(0.1, math.inf)
+            num_range=TIME_RANGE
         )
         command_random = Command(
             'n', 'random', CommandsProblem.RANDOM,
             [arg_random_num], [
-                arg_random_time_limit, arg_random_checker, arg_random_total_timeout
+                arg_random_time_limit, arg_checker, arg_random_total_timeout
             ], False,
-            self.message,
+            message,
             [
                 'Run the problem on', arg_random_num.get_name_short(), 'random testcases. When',
                 arg_random_time_limit.short_flag, 'is given, set the time limit to',
-                arg_random_time_limit.get_name_short(), '. When', arg_random_checker.short_flag,
-                'is given, set the checker to', arg_random_checker.get_name_short(), '. When',
+                arg_random_time_limit.get_name_short(), '. When', arg_checker.short_flag,
+                'is given, set the checker to', arg_checker.get_name_short(), '. When',
                 arg_random_total_timeout.short_flag, 'is given, limit the total execution time of the command to',
                 arg_random_total_timeout.get_name_short(), '. Note that this command '
                 'doesn\'t override problem\'s default options and modes.'
@@ -436,44 +536,27 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
         command_paste = Command(
             'p', 'paste', CommandsProblem.PASTE,
             [], [], False,
-            self.message,
+            message,
             [
                 'Copy the code of the problem to clipboard.'
             ]
         )
 
-        # move command
-        # m, move problem
-        arg_move_problem = PositionalArgument(
-            'problem-id', 'problem-id',
-            1, PositionalArgumentMode.CHOICES, self.message,
-            f'problem id to move to, one of {problem_ids}',
-            choices=problem_ids
-        )
-        command_move = Command(
-            'm', 'move', CommandsProblem.MOVE,
-            [arg_move_problem], [], False,
-            self.message,
-            [
-                'Move to the problem', arg_move_problem.get_name_short(), '.'
-            ]
-        )
-
         # alias command
         # a, alias command[?] args[?] [-u]
         arg_alias_command = PositionalArgument(
             'command', 'command',
-            '?', PositionalArgumentMode.ANY, self.message,
+            '?', PositionalArgumentMode.ANY, message,
             'the command to alias if given or show all aliases if not given'
         )
         arg_alias_args = PositionalArgument(
             'args', 'args',
-            '?', PositionalArgumentMode.ANY, self.message,
+            '?', PositionalArgumentMode.ANY, message,
             'the args the command should be aliased to'
         )
         arg_alias_unalias = OptionalArgument(
             '-u', '--unalias', 'unalias',
-            0, OptionalArgumentMode.BOOL_FLAG, self.message,
+            0, OptionalArgumentMode.BOOL_FLAG, message,
             'when set, unalias the command',
             ['False']
         )
@@ -482,7 +565,7 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
             [
                 arg_alias_command, arg_alias_args
             ], [arg_alias_unalias], False,
-            self.message,
+            message,
             [
                 'Alias and unalias commands. When', arg_alias_command.get_name_short(), 'is given, alias',
                 arg_alias_command.get_name_short(), 'to', arg_alias_args.get_name_short(), 'if',
@@ -496,69 +579,44 @@ class CommandSuiteProblem(CommandSuite[CommandsProblem]):
             ]
         )
 
-        # help command
-        # h, help command[?]
-        arg_help_command = PositionalArgument(
-            'command', 'command',
-            '?', PositionalArgumentMode.CHOICES, self.message,
-            'the command to display help for if specified or all otherwise',
-            choices=[
-                command_edit.short_name, command_edit.long_name,
-                command_custom_invocation.short_name, command_custom_invocation.long_name,
-                command_run.short_name, command_run.long_name,
-                command_set.short_name, command_set.long_name,
-                command_input_output.short_name, command_input_output.long_name,
-                command_random.short_name, command_random.long_name,
-                command_paste.short_name, command_paste.long_name,
-                command_move.short_name, command_move.long_name,
-                command_alias.short_name, command_alias.long_name,
-                'h', 'help',
-                'q', 'quit'
-            ] + list(self.alias.get_alias_names())
-        )
-        command_help = Command(
-            'h', 'help', CommandsProblem.HELP,
-            [arg_help_command], [], False,
-            self.message,
-            [
-                'If', arg_help_command.get_name_short(), 'is not given, show short help strings for all commands. '
-                'Otherwise, show long help string for', arg_help_command.get_name_short(), '.'
-            ]
-        )
-
         # quit command
         # q, quit
         command_quit = Command(
             'q', 'quit', CommandsProblem.QUIT,
             [], [], False,
-            self.message,
+            message,
             [
                 'Quit the contest.'
             ]
         )
 
-        # set all_commands
-        self.all_commands = [
-            command_edit,
-            command_custom_invocation,
-            command_run,
-            command_set,
-            command_input_output,
-            command_random,
-            command_paste,
-            command_move,
-            command_alias,
-            command_help,
-            command_quit
-        ]
-
-        # set command_names
-        self.command_names: dict[str, Command[CommandsProblem]] = {}
-        for command in self.all_commands:
-            self.command_names |= {
-                command.short_name: command,
-                command.long_name: command
-            }
+        # the static commands, cached for message
+        return {
+            CommandsProblem.CUSTOM_INVOCATION: command_custom_invocation,
+            CommandsProblem.RUN: command_run,
+            CommandsProblem.SET: command_set,
+            CommandsProblem.RANDOM: command_random,
+            CommandsProblem.PASTE: command_paste,
+            CommandsProblem.ALIAS: command_alias,
+            CommandsProblem.QUIT: command_quit
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def get_command_suite_problem(message: Messages, config: Configs, problem_ids: tuple[str, ...],
+                              num_scraped: int, num_testcases: int) -> CommandSuiteProblem:
+    '''
+    Get the command suite for problems, reused while the arguments are the same.
+    The cache should be cleared with get_command_suite_problem.cache_clear() when the aliases change
+    since the suites hold the aliases and list them as help choices.
+    :param message: the message object that handles printing
+    :param config: the configs object storing configs
+    :param problem_ids: the problem ids
+    :param num_scraped: the number of scraped testcases
+    :param num_testcases: the number of testcases
+    :return: the command suite for problems
+    '''
+    return CommandSuiteProblem(message, config, list(problem_ids), num_scraped, num_testcases)
 
 
 class CommandsParser(IntEnum):
@@ -572,8 +630,11 @@ class CommandsParser(IntEnum):
 
 class CommandSuiteParser(CommandSuite[CommandsParser]):
     '''An immutable command suite for the parser.'''
-    all_commands: list[Command[CommandsParser]]  # the list of commands
-    command_names: dict[str, Command[CommandsParser]]  # the dict of command names to commands
+    __slots__ = ('all_commands', 'command_names', 'command_first_chars', 'resolved_names', 'message', 'config', 'alias')
+    all_commands: tuple[Command[CommandsParser], ...]  # the commands
+    command_names: MappingProxyType[str, Command[CommandsParser]]  # the read-only dict of command names to commands
+    command_first_chars: frozenset[str]  # the first chars of command and alias names, to reject others without a lookup
+    resolved_names: dict[str, tuple[Command[CommandsParser], tuple[str, ...]]]  # names to (command, alias args or ())
     message: Messages  # the message object that handles printing
     config: Configs  # the configs object storing configs
     alias: Aliases  # the aliases
@@ -667,12 +728,7 @@ class CommandSuiteParser(CommandSuite[CommandsParser]):
             'command', 'command',
             '?', PositionalArgumentMode.CHOICES, self.message,
             'the command to display help for if specified or all otherwise',
-            choices=[
-                command_codeforces.short_name, command_codeforces.long_name,
-                command_config.short_name, command_config.long_name,
-                'h', 'help',
-                'q', 'quit'
-            ] + list(self.alias.get_alias_names())
+            choices=[*COMMAND_NAMES_PARSER, *self.alias.get_alias_names()]
         )
         command_help = Command(
             'h', 'help', CommandsParser.HELP,
@@ -696,18 +752,19 @@ class CommandSuiteParser(CommandSuite[CommandsParser]):
         )
 
         # set all_commands
-        self.all_commands = [
+        self.all_commands = (
             command_codeforces,
             command_config,
             command_alias,
             command_help,
             command_quit
-        ]
+        )
 
         # set command_names
-        self.command_names: dict[str, Command[CommandsParser]] = {}
-        for command in self.all_commands:
-            self.command_names |= {
-                command.short_name: command,
-                command.long_name: command
-            }
+        self.command_names = MappingProxyType({
+            command_name: command
+            for command in self.all_commands
+            for command_name in (command.short_name, command.long_name)
+        })
+        assert tuple(self.command_names) == COMMAND_NAMES_PARSER  # the help command lists all commands
+        self.set_resolved_names()
@@ -13,6 +13,7 @@ class Configs:
     # the configs folder
     configs_folder: Folder  # the folder containing all config files
     configs_file: File  # the file containing the configs dict
+    configs_dict: dict[str, str]  # the configs dict last read from or written to the configs file
     # the message object
     message: Messages  # the message object that handles printing
     # config items
@@ -167,18 +168,18 @@ class Configs:
 
     def get_configs_dict(self) -> dict[str, str]:
         '''
-        Get the configs dict from the configs file.
+        Get the configs dict from the configs file and keep it to compare against when setting it.
         :return: the configs dict
         '''
         if self.configs_file.file_exists():
-            configs_dict: dict[str, str] = json.loads(self.configs_file.read_file())
-            return configs_dict
+            self.configs_dict = json.loads(self.configs_file.read_file())
         else:
-            return {}
+            self.configs_dict = {}
+        return self.configs_dict
 
     def set_configs_dict(self) -> None:
         '''
-        Update the configs file with the new configs dict.
+        Update the configs file with the new configs dict if it changed.
         '''
         # get the configs dict
         configs_dict: dict[str, str] = {}
@@ -186,8 +187,10 @@ class Configs:
             assert config_item_terminal.value_str is not None  # the value should already be set
             configs_dict[config_item_terminal.name] = config_item_terminal.value_str
 
-        # set the configs dict
-        self.configs_file.write_file(json.dumps(configs_dict))
+        # set the configs dict, the file is kept as is when no config changed
+        if configs_dict != self.configs_dict or not self.configs_file.file_exists():
+            self.configs_file.write_file(json.dumps(configs_dict))
+            self.configs_dict = configs_dict
 
     # the getters for all configs
 
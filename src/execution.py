@@ -39,15 +39,18 @@ class Execution:
     '''Implements execution of commands in the shell.'''
 
     @staticmethod
-    def execute(args: list[str], input_str: Optional[str]) -> ExecuteResult:
+    def execute(args: list[str], input_str: Optional[str | bytes]) -> ExecuteResult:
         '''
         Execute a command with optional input passed to it.
         :param args: the command
-        :param input_str: the input string passed as stdin or None if no input should be passed
+        :param input_str: the input passed as stdin, already encoded if bytes, or None if no input should be passed
         :return: the result of execute
         '''
-        encoded_input_str: Optional[bytes] = input_str.encode('utf-8') if input_str is not None else None
-        completed = subprocess.run(args, input=encoded_input_str, capture_output=True, check=False)
+        encoded_input_str: Optional[bytes] = (
+            input_str.encode('utf-8') if isinstance(input_str, str) else input_str
+        )
+        # fds opened by python are non-inheritable, so they don't have to be closed and posix_spawn can be used
+        completed = subprocess.run(args, input=encoded_input_str, capture_output=True, check=False, close_fds=False)
         return ExecuteResult(
             completed.stdout.decode(encoding='utf-8'),
             completed.stderr.decode(encoding='utf-8'),
@@ -67,11 +70,11 @@ class Execution:
         return CompileResult(execute_result.return_code == 0)
 
     @staticmethod
-    def run(file: File, io_input: str, time_limit: float) -> RunResult:
+    def run(file: File, io_input: str | bytes, time_limit: float) -> RunResult:
         '''
         Run a .cpp program with input and a time limit.
         :param file: the .out file to run
-        :param io_input: the input
+        :param io_input: the input, already encoded if bytes
         :param time_limit: the time limit in seconds
         :return: the result of run
         '''
@@ -83,3 +86,15 @@ class Execution:
             )
         )
         return RunResult(result_type, execute_result.stdout)
+
+    @staticmethod
+    def start(file: File, args: list[str]) -> subprocess.Popen[bytes]:
+        '''
+        Start a .cpp program that keeps running and communicates through pipes.
+        :param file: the .out file to start
+        :param args: the command line arguments passed to the program
+        :return: the started process, stdin and stdout are unbuffered pipes and stderr is discarded
+        '''
+        return subprocess.Popen(  # unbuffered since the pipes are used through their fds
+            [str(file), *args], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0
+        )
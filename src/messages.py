@@ -1,8 +1,8 @@
 '''Implements the messages class for printing messages and getting user input.'''
 
-from typing import TypeVar, Optional, Literal
+from typing import TypeVar, Optional, Literal, Mapping
 from datetime import datetime
-from prints import Print, StylizedStr, Colors, get_terminal_width
+from prints import Print, StylizedStr, StylizedBaseStr, Colors, get_terminal_width
 from verdicts import CompileVerdict, RunVerdict
 from paths import Folder, File
 
@@ -779,7 +779,7 @@ class Messages:
             + StylizedStr(f'"{alias_args}"')
         )
 
-    def alias_all_help_str(self, aliases: dict[str, str]) -> None:
+    def alias_all_help_str(self, aliases: Mapping[str, str]) -> None:
         '''
         Print the help string for all aliases.
         :param aliases: the aliases dict where keys are alias names and values are the args they are aliased to
@@ -1074,7 +1074,8 @@ class Messages:
         :param help_str: the help string, even indices contain (help_str, ""), odd ones contain (arg_name, arg_type)
         :return: the help string for the command
         '''
-        help_stylized_str = StylizedStr()
+        base_strs: list[StylizedBaseStr] = []
+        text_parts: list[str] = []  # the plain text since the last argument, joined into one base string
         for idx, help_str_pair in enumerate(help_str):
             add_space = (
                 idx != 0
@@ -1082,26 +1083,33 @@ class Messages:
                 and (len(help_str[idx - 1][0]) == 0 or help_str[idx - 1][0][-1] != '(')  # no space on '('
             )
             if add_space:
-                help_stylized_str += StylizedStr(' ')
+                text_parts.append(' ')
             if idx % 2 == 0:  # help str
-                help_stylized_str += StylizedStr(help_str_pair[0])
+                text_parts.append(help_str_pair[0])
             else:  # argument
                 short_name, arg_type = help_str_pair
-                help_stylized_str += StylizedStr(short_name, ARGUMENT_COLOR)
+                if len(text_parts) > 0:
+                    base_strs.append(StylizedBaseStr(''.join(text_parts)))
+                    text_parts = []
+                base_strs.append(StylizedBaseStr(short_name, ARGUMENT_COLOR))
                 assert arg_type != '0'  # can't print num_args == 0
                 if arg_type not in ('f', '1'):
-                    help_stylized_str += StylizedStr(f'[{arg_type}]')
+                    text_parts.append(f'[{arg_type}]')
+        help_text = ''.join(text_parts)
+        if help_text != '':
+            base_strs.append(StylizedBaseStr(help_text))
+        help_stylized_str = StylizedStr.make_stylized_string(base_strs)
         return help_stylized_str
 
     def command_help_str(self, command_name: str, positional_arguments: list[tuple[str, str]],
-                         optional_arguments: list[tuple[str, str, str]], help_str: list[str],
+                         optional_arguments: list[tuple[str, str, str]], help_str: list[tuple[str, str]],
                          mutually_exclusive: bool) -> None:
         '''
         Print the help string for the command.
         :param command_name: the command's name
         :param positional_arguments: the positional arguments, list of (short_name, arg_type)
         :param optional_arguments: the optional arguments, list of (short_name, short_flag, arg_type)
-        :param help_str: the help string, odd indices contain arguments' short names or short flags
+        :param help_str: the help string, even indices contain (help_str, ""), odd ones contain (arg_name, arg_type)
         :param mutually_exclusive: are optional arguments mutually exclusive
         '''
         # the usage str
@@ -1122,16 +1130,7 @@ class Messages:
         self.log.print(usage_str)
 
         # the help str
-        arg_types: dict[str, str] = (
-            {short_name: arg_type for short_name, arg_type in positional_arguments}
-            | {short_name: arg_type for short_name, _, arg_type in optional_arguments}
-            | {flag: 'f' for _, flag, _ in optional_arguments}
-        )
-        help_str_pairs: list[tuple[str, str]] = [
-            (help_str_pair, '') if idx % 2 == 0 else (help_str_pair, arg_types[help_str_pair])
-            for idx, help_str_pair in enumerate(help_str)
-        ]
-        self.log.print(self.helper_command_help_str(help_str_pairs))
+        self.log.print(self.helper_command_help_str(help_str))
 
     # COMMAND SUITES
 
@@ -100,13 +100,27 @@ class File:
         with open(str(self), 'r', encoding='utf-8') as f:
             return f.read()
 
-    def write_file(self, contents: str) -> None:
+    def write_file(self, contents: str | bytes) -> None:
         '''
         Write contents to the file, overriding if the file isn't empty. Creates the file if it doesn't exist.
+        :param contents: the contents to write, bytes are written as is
+        '''
+        if isinstance(contents, bytes):
+            with open(str(self), 'wb') as fb:
+                fb.write(contents)
+        else:
+            with open(str(self), 'w', encoding='utf-8') as f:
+                f.write(contents)
+
+    def write_file_atomic(self, contents: str) -> None:
+        '''
+        Write contents to the file atomically by writing a temporary file next to it and replacing the file with it.
+        Creates the file if it doesn't exist.
         :param contents: the contents to write
         '''
-        with open(str(self), 'w', encoding='utf-8') as f:
-            f.write(contents)
+        temp_file = File(self.path[:-1] + [self.path[-1] + '.tmp'])
+        temp_file.write_file(contents)
+        os.replace(str(temp_file), str(self))
 
     def append_file(self, contents: str) -> None:
         '''
@@ -11,7 +11,7 @@ from testcases import TestCase, TestCaseMode, TestCaseType, IOPair, TestCaseSet
 import checkers
 from checkers import Checker
 from runners import Runner
-from commandsuites import CommandSuiteProblem, CommandsProblem
+from commandsuites import CommandsProblem, get_command_suite_problem
 from execution import Execution
 from configs import Configs
 
@@ -73,7 +73,9 @@ class Problem:
 
         # creating the edit files
         # TODO: move creating files into classes
-        cpp_header = self.config.cpp_header.rstrip('\n') + '\n\n'  # the cpp header with an empty line at the end
+        cpp_header = (  # the cpp header with an empty line at the end, encoded like the base files
+            (self.config.cpp_header.rstrip('\n') + '\n\n').encode('utf-8')
+        )
         self.dirs.get_main().write_file(cpp_header + basefiles.MAIN_CPP)
         self.dirs.get_custom_checker().write_file(cpp_header + basefiles.CHECKER_CPP)
         self.dirs.get_bruteforce().write_file(cpp_header + basefiles.BRUTEFORCE_CPP)
@@ -163,12 +165,13 @@ class Problem:
         :param problem_ids: the problem ids in this contest
         :return: the first parsed command and args not executable in problem
         '''
+        problem_ids_lower = tuple(problem_id.lower() for problem_id in problem_ids)  # once instead of in every suite
         while True:
-            # get the command suite
-            command_suite = CommandSuiteProblem(
+            # get the command suite, reused while the testcases and aliases don't change
+            command_suite = get_command_suite_problem(
                 self.message,
                 self.config,
-                problem_ids,
+                problem_ids_lower,
                 self.testcase_set.get_num_scraped(),
                 len(self.testcase_set)
             )
@@ -363,6 +366,7 @@ class Problem:
                     alias_str_parsed_args[0] if len(alias_str_parsed_args) == 1 else None,
                     json.loads(parsed_args['unalias'])[0] == 'True'
                 )
+                get_command_suite_problem.cache_clear()  # the suites hold the aliases
 
             elif command == CommandsProblem.HELP:
                 help_args = json.loads(parsed_args['command'])
@@ -194,21 +194,24 @@ class Runner:
             run_verdicts[run_index] = RunVerdict.ACCEPTED
             run_queue.put(run_index)
 
-        # prepare the threads and start them
+        # prepare the threads and start them, the checker is closed even if waiting on them is interrupted
         run_threads = [
             Thread(target=run_thread_target, args=(run_index,))
             for run_index in range(run_count)
         ]
-        for thread in run_threads:
-            thread.start()
-
-        # wait on the threads to finish and determine the overall verdict
-        overall_verdict = RunVerdict.ACCEPTED  # the first non accepted verdict or accepted otherwise
-        for _ in range(run_count):
-            finished_index = run_queue.get()
-            if run_verdicts[finished_index] != RunVerdict.ACCEPTED and overall_verdict == RunVerdict.ACCEPTED:
-                overall_verdict = run_verdicts[finished_index]
-            self.message.runner_run_update(compile_verdicts, compile_bracket_verdict, run_verdicts, testcase_ids)
+        try:
+            for thread in run_threads:
+                thread.start()
+
+            # wait on the threads to finish and determine the overall verdict
+            overall_verdict = RunVerdict.ACCEPTED  # the first non accepted verdict or accepted otherwise
+            for _ in range(run_count):
+                finished_index = run_queue.get()
+                if run_verdicts[finished_index] != RunVerdict.ACCEPTED and overall_verdict == RunVerdict.ACCEPTED:
+                    overall_verdict = run_verdicts[finished_index]
+                self.message.runner_run_update(compile_verdicts, compile_bracket_verdict, run_verdicts, testcase_ids)
+        finally:
+            checker.close()  # all checks are done or the run was interrupted
 
         self.message.runner_finish(
             compile_verdicts, compile_bracket_verdict, run_verdicts, testcase_ids, overall_verdict
@@ -1,15 +1,31 @@
 '''Scraper protocol with implementations for each platform.'''
 
 import json
+import atexit
+import functools
+from datetime import timedelta
 from typing import Protocol, TypedDict, Optional
 from itertools import batched
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from messages import Messages
 from configs import Configs
+from paths import Folder
 from more_itertools import split_before
 
 
+# the compiled xpaths used when scraping Codeforces problems
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"  # matches one of the classes
+_HOLDER = etree.XPath('//*[' + _HAS_CLASS.format('problemindexholder') + ']')
+_TITLE = etree.XPath('.//*[' + _HAS_CLASS.format('header') + ']//*[' + _HAS_CLASS.format('title') + ']')
+_TIME_LIMIT = etree.XPath('.//*[' + _HAS_CLASS.format('time-limit') + ']')
+_PRE = etree.XPath('.//*[' + _HAS_CLASS.format('sample-tests') + ']//pre')
+
+
 class ProblemOnline(TypedDict):
     '''A type representing an online problem.'''
     id: str  # problem's id
@@ -87,21 +103,30 @@ class ScraperCodeforces(Scraper):
         :param html_data: the html data if the contest was parsed offline else None
         :returns a list of problems
         '''
-        soup = BeautifulSoup(
-            (
-                read_online(ScraperCodeforces.get_contest_url(contest_id), message, config) if html_data is None
-                else html_data
-            ),
-            'html.parser'
-        )
-        problem_tags = soup.find_all(class_='problemindexholder')
+        if html_data is not None:
+            return ScraperCodeforces.parse_problems(html_data)
+
+        contest_url = ScraperCodeforces.get_contest_url(contest_id)
+        problems = ScraperCodeforces.parse_problems(read_online(contest_url, message, config))
+        if len(problems) == 0:  # don't keep a page without problems cached, e.g. before the contest starts
+            get_session().cache.delete(urls=[contest_url])
+        return problems
+
+    @staticmethod
+    def parse_problems(html_data: str) -> list[ProblemOnline]:
+        '''
+        Parses all problems from the html data of a Codeforces contest.
+        :param html_data: the html data of the contest
+        :returns a list of problems
+        '''
+        document = lxml.html.fromstring(html_data)
         problems: list[ProblemOnline] = []
-        for problem_tag in problem_tags:
+        for problem_tag in _HOLDER(document):
             # create a problem and get id, name, and time limit
             problem: ProblemOnline = {
-                'id': problem_tag['problemindex'],
-                'name': problem_tag.find(class_='header').find(class_='title').string,
-                'time_limit': float(str(problem_tag.find(class_='time-limit').contents[1]).split()[0]),
+                'id': str(problem_tag.get('problemindex')),
+                'name': ''.join(_TITLE(problem_tag)[0].itertext()),
+                'time_limit': float(_TIME_LIMIT(problem_tag)[0][0].tail.split()[0]),  # the text after the title
                 'io': [],
                 'io_multitest_inputs': None,
                 'io_multitest_outputs': None
@@ -110,21 +135,22 @@ class ScraperCodeforces(Scraper):
             # get entire testcases and try getting multitests
             io_multitest_inputs_all: list[Optional[list[str]]] = []
             io_multitest_outputs_all: list[Optional[list[str]]] = []
-            for io_input_tag, io_output_tag in batched(problem_tag.find(class_='sample-tests').find_all('pre'), n=2):
+            for io_input_tag, io_output_tag in batched(_PRE(problem_tag), n=2):
                 # input
-                io_input = io_prettify('\n'.join(io_input_tag.strings))  # entire testcase
+                io_input = io_prettify('\n'.join(io_input_tag.itertext()))  # entire testcase
                 io_multitest_inputs: Optional[list[str]] = None
-                if io_input_tag.find('div') is not None:
+                line_tags = io_input_tag.findall('.//div')
+                if len(line_tags) > 0:
                     multitests: dict[int, str] = {}
-                    for line_tag in io_input_tag.find_all('div'):
-                        multitest_num = int(str(line_tag['class'][2]).split('-')[-1])
-                        multitests[multitest_num] = multitests.get(multitest_num, '') + line_tag.string + '\n'
+                    for line_tag in line_tags:
+                        multitest_num = int(line_tag.get('class').split()[2].split('-')[-1])
+                        multitests[multitest_num] = multitests.get(multitest_num, '') + (line_tag.text or '') + '\n'
                     if len(multitests) > 1:  # multitests
                         io_multitest_inputs = [one_input[:-1] for one_input in multitests.values()]  # remove '\n'
                 io_multitest_inputs_all.append(io_multitest_inputs)
 
                 # output
-                io_output = io_prettify('\n'.join(io_output_tag.strings))
+                io_output = io_prettify('\n'.join(io_output_tag.itertext()))
                 io_multitest_outputs: Optional[list[str]] = None
                 if io_multitest_inputs is not None:
                     num_multitests = int(io_multitest_inputs[0])  # first line is number of multitests
@@ -196,6 +222,31 @@ class ScraperCodeforces(Scraper):
             return None
 
 
+@functools.cache
+def get_session() -> requests_cache.CachedSession:
+    '''
+    Get the session shared by all requests, created on the first request.
+    :return: the session
+    '''
+    # the connection to the platform is kept alive and reused, successful responses are cached on disk
+    # for an hour so pages seen again soon aren't downloaded again and changed pages are still picked up
+    session = requests_cache.CachedSession(
+        str(Folder(['~', '.config', 'cf-parser']).down_file('http_cache.sqlite')),
+        expire_after=timedelta(hours=1),
+        allowable_codes=(200,),
+        cache_control=True
+    )
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4, pool_maxsize=20,
+        max_retries=Retry(
+            total=5, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False
+        )
+    ))
+    session.headers['User-Agent'] = 'cf-parser'
+    atexit.register(session.close)
+    return session
+
+
 def read_online(url: str, message: Messages, config: Optional[Configs]) -> str:
     '''
     Read the contents of a website url.
@@ -204,9 +255,13 @@ def read_online(url: str, message: Messages, config: Optional[Configs]) -> str:
     :param config: the configs object storing configs if the html should be stored in offline_html or None otherwise
     :returns: the contents of the website
     '''
-    response = requests.get(url)
-    while response.status_code != 200:
-        response = requests.get(url)
+    session = get_session()
+    response: Optional[requests.Response] = None
+    while response is None or response.status_code != 200:
+        try:
+            response = session.get(url, timeout=10)
+        except requests.exceptions.RequestException:  # timeouts and connection errors are retried like bad statuses
+            response = None
     html_data = response.text
     if config is not None:
         config.offline_html.write_file(html_data)
@@ -220,6 +275,4 @@ def io_prettify(io: str) -> str:
     :param io: the io
     :returns: the prettified io
     '''
-    io = io.strip('\n')
-    io += '\n' if (not io or io[-1] != '\n') else ''
-    return io
+    return io.strip('\n') + '\n'  # stripped io never ends with a newline